@@ -4,6 +4,6 @@
 Program for performing NCAs in Python
 """
 
-from .module import pk_dummy_data, pk_data
+from .module import pk_dummy_data, pk_data, pk_store
 
-__all__ = ["pk_dummy_data", "pk_data"]
+__all__ = ["pk_dummy_data", "pk_data", "pk_store"]
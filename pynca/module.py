@@ -62,20 +62,82 @@ class pk_dummy_data:
 
         return self.df
 
+class pk_store:
+    '''Compact columnar store of PK data: TIME/CONC/DOSE arrays grouped by subject, with CSR-style offsets.'''
+    __slots__ = ("ids", "id_index", "offsets", "time", "conc", "dose")
+
+    def __init__(self, ids, offsets, time, conc, dose):
+        '''Wrap pre-grouped arrays; subject i occupies rows offsets[i]:offsets[i + 1].'''
+        self.ids = ids
+        self.id_index = {ID: i for i, ID in enumerate(ids)}
+        self.offsets = offsets
+        self.time = time
+        self.conc = conc
+        self.dose = dose
+
+    @classmethod
+    def from_frame(cls, df):
+        '''Build the store from a long-format DataFrame. Columns other than ID/TIME/CONC/DOSE are dropped.'''
+        missing = [col for col in ['ID', 'TIME', 'CONC', 'DOSE'] if col not in df.columns]
+        if missing:
+            raise ValueError(f"Input data is missing required column(s): {', '.join(missing)}.")
+        if df['ID'].isna().any():
+            raise ValueError("Input data contains row(s) with a missing 'ID'.")
+
+        # IDs keep their order of first appearance; rows keep their order within each subject
+        codes, ids = pd.factorize(df['ID'])
+        order = np.argsort(codes, kind='stable')
+        offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(ids)), out=offsets[1:])
+
+        # Source dtypes are kept so results (e.g. integer TIME values) match the input
+        def column(name):
+            return df[name].to_numpy()[order]
+
+        return cls(np.asarray(ids), offsets, column('TIME'), column('CONC'), column('DOSE'))
+
+    def __len__(self):
+        '''Number of subjects.'''
+        return len(self.ids)
+
+    def subject(self, i):
+        '''Return (time, conc, dose) views for the i-th subject without copying.'''
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        return self.time[lo:hi], self.conc[lo:hi], self.dose[lo:hi]
+
+    def to_frame(self):
+        '''Rebuild a long-format DataFrame (ID, TIME, DOSE, CONC) from the store.'''
+        return pd.DataFrame({
+            "ID": np.repeat(self.ids, np.diff(self.offsets)),
+            "TIME": self.time,
+            "DOSE": self.dose,
+            "CONC": self.conc
+        })
+
 class pk_data:
     def __init__(self, data):
         '''Initialize the pk_data object. Accepts either a DataFrame or a CSV file path.'''
         if isinstance(data, str):  # If a file path is given
-            self.df = pd.read_csv(data)
-        elif isinstance(data, pd.DataFrame):
-            self.df = data
-        else:
+            data = pd.read_csv(data)
+        elif not isinstance(data, pd.DataFrame):
             raise ValueError("Input data must be a DataFrame or a path to a CSV file.")
 
-        self.list_ids = self.df['ID'].unique()
+        self.df = data
+
+    @property
+    def df(self):
+        '''A read-only snapshot of the PK data as a DataFrame, rebuilt from the store on each access.
+        Edits to the returned frame are not seen by the NCA methods; assign a new frame to 'df' instead.'''
+        return self.store.to_frame()
+
+    @df.setter
+    def df(self, data):
+        self.store = pk_store.from_frame(data)
+        self.list_ids = self.store.ids
 
     def summarize(self):
-        summ = self.df.groupby('TIME')['CONC'].agg(["count", "mean", "std", "median", "min", "max"]).reset_index()
+        time_conc = pd.DataFrame({"TIME": self.store.time, "CONC": self.store.conc})
+        summ = time_conc.groupby('TIME')['CONC'].agg(["count", "mean", "std", "median", "min", "max"]).reset_index()
         return summ
         
     def summ_stats(self, vals:list, stat=['mean', 'sd', 'min', 'max', 'Q1', 'median', 'Q3', 'IQR']):
@@ -104,10 +166,10 @@ class pk_data:
 
     def half_life(self, term_elim_times:list, stat=['mean', 'sd', 'min', 'max', 'Q1', 'median', 'Q3', 'IQR']):
         half_lives = []
-        for ID in self.list_ids:
-            subset = self.df.loc[self.df['ID'] == ID]
-            ln_conc = np.log(subset['CONC'])
-            slope, _, r_value, _, _ = linregress(subset['TIME'], ln_conc)
+        for i in range(len(self.store)):
+            time, conc, _ = self.store.subject(i)
+            ln_conc = np.log(conc)
+            slope, _, r_value, _, _ = linregress(time, ln_conc)
             if slope >= 0:
                 continue  # biologically invalid slope, skip
             half_life = np.log(2) / -slope
@@ -115,23 +177,23 @@ class pk_data:
         return self.summ_stats(half_lives, stat=stat)
 
     def cmax(self, stat=['mean', 'sd', 'min', 'max', 'Q1', 'median', 'Q3', 'IQR']):
-        cmax_vals = self.df.groupby('ID')['CONC'].max()
+        cmax_vals = np.fmax.reduceat(self.store.conc, self.store.offsets[:-1])
         return self.summ_stats(cmax_vals, stat=stat)
 
     def tmax(self, stat=['mean', 'sd', 'min', 'max', 'Q1', 'median', 'Q3', 'IQR']):
         tmax_vals = []
-        for ID in self.list_ids:
-            subset = self.df.loc[self.df['ID'] == ID]
-            tmax = subset.loc[subset['CONC'] == subset['CONC'].max()]['TIME'].iloc[0]
+        for i in range(len(self.store)):
+            time, conc, _ = self.store.subject(i)
+            tmax = time[np.nanargmax(conc)]
             tmax_vals.append(tmax)
         return self.summ_stats(tmax_vals, stat=stat)
 
     def auc(self, start:int, end:int, stat=['mean', 'sd', 'min', 'max', 'Q1', 'median', 'Q3', 'IQR'], ind=False):
         auc_vals = []
-        for ID in self.list_ids:
-            subset_id = self.df.loc[self.df['ID'] == ID]
-            subset_time = subset_id[(subset_id['TIME'] >= start) & (subset_id['TIME'] <= end)]
-            auc = np.trapezoid(subset_time['CONC'], subset_time['TIME'])
+        for i in range(len(self.store)):
+            time, conc, _ = self.store.subject(i)
+            in_window = (time >= start) & (time <= end)
+            auc = np.trapezoid(conc[in_window], time[in_window])
             auc_vals.append(auc)
 
         if ind:
@@ -144,11 +206,12 @@ class pk_data:
             print("NB: The current iteration of 'vd()' only works for a single bolus dose given at 'TIME' == 0.")
         
         vd_vals = []
-        for ID in self.list_ids:
-            subset = self.df.loc[(self.df['ID'] == ID) & (self.df['TIME'] == 0)]
-            dose = subset['DOSE'].iloc[0]
-            c0 = subset['CONC'].iloc[0]
-            vd = dose / c0
+        for i in range(len(self.store)):
+            time, conc, dose = self.store.subject(i)
+            t0 = np.flatnonzero(time == 0)
+            if len(t0) == 0:
+                raise ValueError(f"Subject {self.list_ids[i]} has no observation at 'TIME' == 0.")
+            vd = dose[t0[0]] / conc[t0[0]]
             vd_vals.append(vd)
         return self.summ_stats(vd_vals, stat=stat)
 
@@ -156,9 +219,14 @@ class pk_data:
         if not silence_message:
             print("NB: The current iteration of 'cl()' only works for a single bolus dose given at 'TIME' == 0.")
             
-        subset = self.df.loc[self.df['DOSE'] != 0].copy().reset_index()
         auc = self.auc(start=start, end=end, ind=True)
-        cl_vals = subset['DOSE'] / auc
+        cl_vals = []
+        for i in range(len(self.store)):
+            _, _, dose = self.store.subject(i)
+            dose_rows = np.flatnonzero(dose != 0)
+            if len(dose_rows) != 1:
+                raise ValueError(f"Subject {self.list_ids[i]} has {len(dose_rows)} nonzero 'DOSE' records; exactly one is required.")
+            cl_vals.append(dose[dose_rows[0]] / auc[i])
         return self.summ_stats(cl_vals, stat=stat)
     
     def plot(self, summarized=False, log_scale=False):
@@ -0,0 +1,92 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pynca import pk_data, pk_store
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "example_data")
+DATASETS = ["pk_dummy_iv_bolus_1cmt.csv", "test_data.csv"]
+
+
+def load(name, shuffled):
+    df = pd.read_csv(os.path.join(DATA_DIR, name))
+    if shuffled:
+        # Interleave subjects while keeping each subject's rows in time order
+        df = df.sample(frac=1, random_state=0).sort_values('TIME', kind='stable').reset_index(drop=True)
+    return df
+
+
+def by_id(df):
+    '''Per-subject frames in order of first ID appearance, as the original DataFrame code produced them.'''
+    return [df.loc[df['ID'] == ID] for ID in df['ID'].unique()]
+
+
+@pytest.mark.parametrize("name", DATASETS)
+def test_round_trip(name):
+    df = load(name, shuffled=False)
+    out = pk_store.from_frame(df).to_frame()
+    expected = df[["ID", "TIME", "DOSE", "CONC"]]
+    pd.testing.assert_frame_equal(out, expected)
+
+
+@pytest.mark.parametrize("shuffled", [False, True])
+@pytest.mark.parametrize("name", DATASETS)
+def test_nca_parity(name, shuffled):
+    df = load(name, shuffled)
+    subjects = by_id(df)
+    pk = pk_data(df)
+
+    expected_cmax = pk.summ_stats(df.groupby('ID')['CONC'].max())
+    expected_tmax = pk.summ_stats([s.loc[s['CONC'] == s['CONC'].max()]['TIME'].iloc[0] for s in subjects])
+    auc_vals = [np.trapezoid(s['CONC'], s['TIME']) for s in subjects]
+    expected_vd = pk.summ_stats([s.loc[s['TIME'] == 0, 'DOSE'].iloc[0] / s.loc[s['TIME'] == 0, 'CONC'].iloc[0]
+                                 for s in subjects])
+    expected_cl = pk.summ_stats([s.loc[s['DOSE'] != 0, 'DOSE'].iloc[0] / a for s, a in zip(subjects, auc_vals)])
+
+    start, end = df['TIME'].min(), df['TIME'].max()
+    pd.testing.assert_frame_equal(pk.cmax(), expected_cmax)
+    pd.testing.assert_frame_equal(pk.tmax(), expected_tmax)
+    pd.testing.assert_frame_equal(pk.auc(start=start, end=end), pk.summ_stats(auc_vals))
+    pd.testing.assert_frame_equal(pk.vd(silence_message=True), expected_vd)
+    pd.testing.assert_frame_equal(pk.cl(start=start, end=end, silence_message=True), expected_cl)
+
+
+def test_source_dtypes_kept():
+    df = load("test_data.csv", shuffled=False)
+    pk = pk_data(df)
+    assert pk.summarize()['TIME'].dtype == df['TIME'].dtype
+    assert pk.df['TIME'].dtype == df['TIME'].dtype
+
+
+def test_df_setter_replaces_data():
+    df = load("test_data.csv", shuffled=False)
+    pk = pk_data(df)
+    doubled = df.assign(CONC=df['CONC'] * 2)
+    pk.df = doubled
+    assert pk.cmax()['max'].iloc[0] == doubled['CONC'].max()
+
+
+def test_missing_id_rejected():
+    df = load("test_data.csv", shuffled=False)
+    df['ID'] = df['ID'].astype(float)
+    df.loc[0, 'ID'] = np.nan
+    with pytest.raises(ValueError, match="missing 'ID'"):
+        pk_data(df)
+
+
+def test_cl_dose_count_mismatch():
+    df = load("pk_dummy_iv_bolus_1cmt.csv", shuffled=False)
+    df.loc[df['ID'] != 1, 'DOSE'] = 0
+    pk = pk_data(df)
+    with pytest.raises(ValueError, match="nonzero 'DOSE'"):
+        pk.cl(start=0, end=df['TIME'].max(), silence_message=True)
+
+
+def test_vd_without_time_zero():
+    df = load("test_data.csv", shuffled=False)
+    df = df.loc[~((df['ID'] == 1) & (df['TIME'] == 0))]
+    pk = pk_data(df)
+    with pytest.raises(ValueError, match="'TIME' == 0"):
+        pk.vd(silence_message=True)